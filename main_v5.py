@@ -6,12 +6,17 @@ Usage:
 """
 
 import argparse
+import atexit
 import os
 import sys
 import time
+from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_ROOT = Path(__file__).resolve().parent
+
+# Add project root to path (once, even if this module is imported repeatedly)
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
 
 from src.market_data import create_examples, split_examples
 from src.evolution_v5 import EvolutionEngine, EvolutionConfig, evaluate_batch, SEED_STRATEGIES
@@ -30,14 +35,13 @@ def main():
     parser.add_argument("--no-merge", action="store_true", help="Disable structural merge")
     parser.add_argument("--output", type=str, default=None, help="Output JSON file")
     parser.add_argument("--resume", type=str, default=None, help="Resume from checkpoint JSON file")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel LLM calls per evaluation batch")
     args = parser.parse_args()
     
     # Load data
-    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-    asset_file = f"{args.asset.lower()}_daily_365.json"
-    filepath = os.path.join(data_dir, asset_file)
+    filepath = _ROOT / "data" / f"{args.asset.lower()}_daily_365.json"
     
-    if not os.path.exists(filepath):
+    if not filepath.exists():
         print(f"Error: {filepath} not found. Run src/market_data.py first.")
         sys.exit(1)
     
@@ -62,18 +66,18 @@ def main():
         dev_batch_size=args.dev_batch,
         enable_merge=not args.no_merge,
         llm_kwargs=llm_kwargs,
+        eval_concurrency=args.concurrency,
     )
     
     # Log file
-    log_file = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        f"v5_output_{args.asset.lower()}_{int(time.time())}.log"
-    )
+    log_file = _ROOT / f"v5_output_{args.asset.lower()}_{int(time.time())}.log"
     
+    # Opened once for the whole run; line buffering keeps `tail -f` live
+    log_fh = open(log_file, "a", buffering=1)
+    atexit.register(log_fh.close)
+
     def log_callback(msg):
-        with open(log_file, "a") as f:
-            f.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
-            f.flush()
+        log_fh.write(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
     
     print(f"\nLog: {log_file}")
     print(f"Config: pop={config.population_size}, gens={config.max_generations}, "
@@ -81,7 +85,7 @@ def main():
     print(f"LLM: {args.model} @ {args.base_url}")
     
     # Checkpoint directory
-    checkpoint_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkpoints")
+    checkpoint_dir = _ROOT / "checkpoints"
     
     # Resume from checkpoint if specified
     resume_checkpoint = None
@@ -109,7 +113,7 @@ def main():
     total_time = time.time() - start_time
     
     # Final test
-    test_accuracy, test_preds = evaluate_batch(best, test, llm_kwargs)
+    test_accuracy, test_preds = evaluate_batch(best, test, llm_kwargs, concurrency=args.concurrency)
     
     print(f"\n{'='*60}")
     print(f"FINAL RESULTS — Célula Madre V5 ({args.asset})")
@@ -122,10 +126,7 @@ def main():
     print(f"\nBest strategy:\n{best.strategy_prompt}")
     
     # Save results
-    output = args.output or os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        f"v5_results_{args.asset.lower()}.json"
-    )
+    output = args.output or _ROOT / f"v5_results_{args.asset.lower()}.json"
     engine.save_results(output, best, test_accuracy)
 
 
@@ -5,6 +5,29 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Shared styling set once; constrained layout replaces per-figure
+# tight_layout() passes
+plt.rcParams.update({
+    'font.size': 10,
+    'axes.labelsize': 12,
+    'axes.titlesize': 13,
+    'axes.titleweight': 'bold',
+    'legend.fontsize': 9,
+    'figure.constrained_layout.use': True,
+})
+
+
+def save(fig, name):
+    """Write the PDF used by the paper plus a lighter PNG preview."""
+    fig.savefig(f'figures/{name}.png', dpi=150, bbox_inches='tight')
+    fig.savefig(f'figures/{name}.pdf', bbox_inches='tight')
+    print(f"Saved {name}.png/pdf")
+
+
+# One Figure is reused for every plot (cleared between them) instead of
+# creating a new one per plot
+fig, ax = plt.subplots(1, 1, figsize=(6, 4), constrained_layout=True)
+
 # === Figure 1: V6 Gen-over-gen best validation accuracy ===
 # Only reflective R1 has full gen data. Use paper's ASCII chart data for means.
 # From paper: Reflective starts ~78%, jumps to ~83% gen1, plateaus ~85-86%
@@ -14,7 +37,6 @@ import numpy as np
 refl_r1 = [0.91, 0.94, 0.94, 0.94, 0.94, 0.95, 0.95, 0.96, 0.96, 0.96]
 
 # For the group comparison figure, use test scores
-fig, ax = plt.subplots(1, 1, figsize=(6, 4))
 
 # Test accuracy by group
 groups = ['Reflective\n(n=3)', 'Random\n(n=3)', 'Static\n(estimated)']
@@ -23,58 +45,51 @@ stds = [3.8, 3.6, 2.0]  # static std estimated
 colors = ['#2196F3', '#FF9800', '#9E9E9E']
 
 bars = ax.bar(groups, means, yerr=stds, capsize=8, color=colors, edgecolor='black', linewidth=0.8, alpha=0.85)
-ax.set_ylabel('Test Accuracy (%)', fontsize=12)
-ax.set_title('V6: AG News Test Accuracy by Mutation Strategy', fontsize=13, fontweight='bold')
+ax.set_ylabel('Test Accuracy (%)')
+ax.set_title('V6: AG News Test Accuracy by Mutation Strategy')
 ax.set_ylim(70, 95)
 ax.axhline(y=79, color='gray', linestyle='--', alpha=0.5, label='Gen0 baseline (~79%)')
-ax.legend(fontsize=9)
+ax.legend()
 
 # Add individual run points
 refl_runs = [89.0, 80.5, 81.5]
 rand_runs = [87.0, 78.5, 84.5]
-for i, val in enumerate(refl_runs):
-    ax.scatter(0, val, color='black', s=30, zorder=5, alpha=0.7)
-for i, val in enumerate(rand_runs):
-    ax.scatter(1, val, color='black', s=30, zorder=5, alpha=0.7)
+# One scatter call (one PathCollection) per group rather than per point
+ax.scatter(np.zeros(len(refl_runs)), refl_runs, color='black', s=30, zorder=5, alpha=0.7)
+ax.scatter(np.ones(len(rand_runs)), rand_runs, color='black', s=30, zorder=5, alpha=0.7)
 
 # Annotation
 ax.annotate('p = 0.932\n(n.s.)', xy=(0.5, 86), fontsize=10, ha='center', style='italic')
 ax.annotate('p = 0.041*', xy=(0.5, 76), fontsize=10, ha='center', style='italic', color='green')
 
-plt.tight_layout()
-plt.savefig('figures/v6_test_accuracy.png', dpi=300, bbox_inches='tight')
-plt.savefig('figures/v6_test_accuracy.pdf', bbox_inches='tight')
-print("Saved v6_test_accuracy.png/pdf")
+save(fig, 'v6_test_accuracy')
 
 # === Figure 2: Reflective R1 generational trajectory ===
-fig2, ax2 = plt.subplots(1, 1, figsize=(6, 4))
+fig.clf()
+ax2 = fig.add_subplot(111)
 gens = list(range(10))
 ax2.plot(gens, [v*100 for v in refl_r1], 'o-', color='#2196F3', linewidth=2, markersize=6, label='Reflective Run 1')
 ax2.axhline(y=79, color='gray', linestyle='--', alpha=0.5, label='Gen0 baseline (~79%)')
-ax2.set_xlabel('Generation', fontsize=12)
-ax2.set_ylabel('Best Validation Accuracy (%)', fontsize=12)
-ax2.set_title('V6: Generational Improvement (Reflective Run 1)', fontsize=13, fontweight='bold')
+ax2.set_xlabel('Generation')
+ax2.set_ylabel('Best Validation Accuracy (%)')
+ax2.set_title('V6: Generational Improvement (Reflective Run 1)')
 ax2.set_ylim(75, 100)
 ax2.set_xticks(gens)
-ax2.legend(fontsize=9)
-plt.tight_layout()
-plt.savefig('figures/v6_gen_trajectory.png', dpi=300, bbox_inches='tight')
-plt.savefig('figures/v6_gen_trajectory.pdf', bbox_inches='tight')
-print("Saved v6_gen_trajectory.png/pdf")
+ax2.legend()
+save(fig, 'v6_gen_trajectory')
 
 # === Figure 3: V4 comparison ===
-fig3, ax3 = plt.subplots(1, 1, figsize=(5, 4))
+fig.clf()
+fig.set_size_inches(5, 4)
+ax3 = fig.add_subplot(111)
 groups_v4 = ['Guided\nMutation', 'Random\nMutation']
 means_v4 = [90.81, 208.57]
 colors_v4 = ['#F44336', '#4CAF50']
 bars = ax3.bar(groups_v4, means_v4, color=colors_v4, edgecolor='black', linewidth=0.8, alpha=0.85)
-ax3.set_ylabel('Mean Agent Profit', fontsize=12)
-ax3.set_title('V4: Guided vs Random Mutation\n(Cohen\'s d = −2.01, p < 0.0001)', fontsize=12, fontweight='bold')
+ax3.set_ylabel('Mean Agent Profit')
+ax3.set_title('V4: Guided vs Random Mutation\n(Cohen\'s d = −2.01, p < 0.0001)', fontsize=12)
 for bar, val in zip(bars, means_v4):
     ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5, f'{val:.1f}', ha='center', fontsize=11, fontweight='bold')
-plt.tight_layout()
-plt.savefig('figures/v4_comparison.png', dpi=300, bbox_inches='tight')
-plt.savefig('figures/v4_comparison.pdf', bbox_inches='tight')
-print("Saved v4_comparison.png/pdf")
+save(fig, 'v4_comparison')
 
 print("\nAll figures generated!")
@@ -6,8 +6,6 @@ The forward() function is the entry point.
 import subprocess
 import re
 from pathlib import Path
-import heapq
-from collections import defaultdict, deque
 
 
 # === EVOLVABLE SECTION START ===
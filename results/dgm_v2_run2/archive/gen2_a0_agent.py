@@ -17,6 +17,22 @@ write a complete Python solution that passes all tests. For JSON parsing tasks,
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_PY_CODE_RE = re.compile(r'```python\s*(.*?)\s*```', re.DOTALL)
+_ANY_CODE_RE = re.compile(r'```\s*.*?python\s*(.*?)\s*```', re.DOTALL)
+
+# Appended to the task prompt when a retry looks like a parsing failure
+_RETRY_SUFFIX = """
+
+IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific functions:
+- parse_value(json_string, index)
+- parse_object(json_string, index) 
+- parse_array(json_string, index)
+- parse_string(json_string, index)
+- parse_number(json_string, index)
+
+Ensure your implementation handles complete JSON structures correctly from the start.
+"""
+
 
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
@@ -41,13 +57,14 @@ def forward(task_description, workspace_dir, test_file="test_solution.py",
     log = []
     
     # Generate solution
-    prompt = f"""Task: {task_description}
+    prompt_base = f"""Task: {task_description}
 
 Initial code stub:
 {initial_code}
 
 Test cases:
 {test_content}"""
+    prompt = prompt_base
     
     max_attempts = 3
     attempt = 0
@@ -58,10 +75,10 @@ Test cases:
             log.append(f"LLM Response (attempt {attempt + 1}): {response[:200]}...")
             
             # Extract Python code from response
-            code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
+            code_match = _PY_CODE_RE.search(response)
             if not code_match:
                 # Try to find any python code block
-                code_match = re.search(r'```\s*.*?python\s*(.*?)\s*```', response, re.DOTALL)
+                code_match = _ANY_CODE_RE.search(response)
             
             if code_match:
                 solution_code = code_match.group(1).strip()
@@ -129,23 +146,7 @@ Test cases:
             # If it's a parsing error and we haven't exhausted attempts, retry with enhanced prompt
             if has_parsing_error and attempt < max_attempts - 1:
                 log.append("Detected potential parsing issue. Retrying with enhanced prompt...")
-                prompt = f"""Task: {task_description}
-
-Initial code stub:
-{initial_code}
-
-Test cases:
-{test_content}
-
-IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific functions:
-- parse_value(json_string, index)
-- parse_object(json_string, index) 
-- parse_array(json_string, index)
-- parse_string(json_string, index)
-- parse_number(json_string, index)
-
-Ensure your implementation handles complete JSON structures correctly from the start.
-"""
+                prompt = prompt_base + _RETRY_SUFFIX
                 attempt += 1
                 continue
             else:
@@ -5,6 +5,7 @@ The forward() function is the entry point.
 """
 import subprocess
 import re
+import shutil
 from pathlib import Path
 
 
@@ -17,6 +18,53 @@ write a complete Python solution that passes all tests. For JSON parsing tasks,
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_PY_CODE_RE = re.compile(r'```python\s*(.*?)\s*```', re.DOTALL)
+_ANY_CODE_RE = re.compile(r'```\s*\w*\s*(.*?)\s*```', re.DOTALL)
+# Resolved once, keeping the old 'python' then 'python3' preference
+_PYTHON = shutil.which('python') or shutil.which('python3') or 'python3'
+
+# Appended to the task prompt when a retry looks like a parsing failure
+_RETRY_SUFFIX = """
+
+IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific functions:
+
+1. parse_value(json_string, index) - Main entry point that dispatches to appropriate parsers
+2. parse_object(json_string, index) - Parse JSON objects {...} 
+3. parse_array(json_string, index) - Parse JSON arrays [...]
+4. parse_string(json_string, index) - Parse quoted strings
+5. parse_number(json_string, index) - Parse numbers
+
+Key requirements:
+- All functions must return (value, new_index) tuples to track position correctly
+- Handle commas properly between elements in objects and arrays  
+- Support nested structures recursively
+- Handle whitespace around tokens appropriately
+- Implement proper error handling for malformed JSON
+
+Example structure:
+def parse_value(json_string, index):
+    # Skip whitespace first
+    while index < len(json_string) and json_string[index].isspace():
+        index += 1
+    
+    if index >= len(json_string):
+        raise ValueError("Unexpected end of string")
+        
+    char = json_string[index]
+    
+    if char == '{':
+        return parse_object(json_string, index)
+    elif char == '[':
+        return parse_array(json_string, index)
+    elif char == '"':
+        return parse_string(json_string, index)
+    else:
+        # Handle numbers and literals
+        pass
+
+Ensure your implementation handles complete JSON structures correctly from the start.
+"""
+
 
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
@@ -42,13 +90,14 @@ def forward(task_description, workspace_dir, test_file="test_solution.py",
     log = []
     
     # Generate solution with enhanced prompt for recursive descent parsing
-    prompt = f"""Task: {task_description}
+    prompt_base = f"""Task: {task_description}
 
 Initial code stub:
 {initial_code}
 
 Test cases:
 {test_content}"""
+    prompt = prompt_base
 
     max_attempts = 3
     attempt = 0
@@ -59,10 +108,10 @@ Test cases:
             log.append(f"LLM Response (attempt {attempt + 1}): {response[:200]}...")
             
             # Extract Python code from response
-            code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
+            code_match = _PY_CODE_RE.search(response)
             if not code_match:
                 # Try to find any python code block (more flexible matching)
-                code_match = re.search(r'```\s*\w*\s*(.*?)\s*```', response, re.DOTALL)
+                code_match = _ANY_CODE_RE.search(response)
             
             if code_match:
                 solution_code = code_match.group(1).strip()
@@ -96,12 +145,13 @@ Test cases:
         
         # Run tests with multiple Python command fallbacks
         test_result = None
-        python_commands = ['python', 'python3']
+        python_commands = [_PYTHON]
+        test_path_str = str(test_path)
         
         for cmd in python_commands:
             try:
                 result = subprocess.run(
-                    [cmd, str(test_path)],
+                    [cmd, test_path_str],
                     cwd=workspace_dir,
                     capture_output=True,
                     text=True,
@@ -154,52 +204,7 @@ Test cases:
         # If it's a parsing error and we haven't exhausted attempts, retry with enhanced prompt
         if has_parsing_error and attempt < max_attempts - 1:
             log.append("Detected potential parsing issue. Retrying with enhanced recursive descent prompt...")
-            prompt = f"""Task: {task_description}
-
-Initial code stub:
-{initial_code}
-
-Test cases:
-{test_content}
-
-IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific functions:
-
-1. parse_value(json_string, index) - Main entry point that dispatches to appropriate parsers
-2. parse_object(json_string, index) - Parse JSON objects {{...}} 
-3. parse_array(json_string, index) - Parse JSON arrays [...]
-4. parse_string(json_string, index) - Parse quoted strings
-5. parse_number(json_string, index) - Parse numbers
-
-Key requirements:
-- All functions must return (value, new_index) tuples to track position correctly
-- Handle commas properly between elements in objects and arrays  
-- Support nested structures recursively
-- Handle whitespace around tokens appropriately
-- Implement proper error handling for malformed JSON
-
-Example structure:
-def parse_value(json_string, index):
-    # Skip whitespace first
-    while index < len(json_string) and json_string[index].isspace():
-        index += 1
-    
-    if index >= len(json_string):
-        raise ValueError("Unexpected end of string")
-        
-    char = json_string[index]
-    
-    if char == '{{':
-        return parse_object(json_string, index)
-    elif char == '[':
-        return parse_array(json_string, index)
-    elif char == '"':
-        return parse_string(json_string, index)
-    else:
-        # Handle numbers and literals
-        pass
-
-Ensure your implementation handles complete JSON structures correctly from the start.
-"""
+            prompt = prompt_base + _RETRY_SUFFIX
             attempt += 1
             continue
         else:
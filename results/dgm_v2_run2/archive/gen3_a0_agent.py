@@ -5,6 +5,7 @@ The forward() function is the entry point.
 """
 import subprocess
 import re
+import shutil
 from pathlib import Path
 
 
@@ -17,6 +18,42 @@ write a complete Python solution that passes all tests. For JSON parsing tasks,
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_ANY_CODE_RE = re.compile(r'```\s*\w*\s*(.*?)\s*```', re.DOTALL)
+# Resolved once, keeping the old 'python' then 'python3' preference
+_PYTHON = shutil.which('python') or shutil.which('python3') or 'python3'
+
+
+# Appended to the task prompt when a retry is needed
+_RETRY_SUFFIX = """
+
+IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific requirements:
+
+1. All parse functions must return (value, new_index) tuples to track position correctly
+2. Parse_object and parse_array must properly advance their index variables on each iteration 
+3. Handle commas correctly between elements in objects and arrays  
+4. Implement early termination conditions to prevent infinite recursion or loops
+5. Ensure all loop bodies actually modify loop control variables (no infinite loops)
+6. Support nested structures recursively with proper depth management
+7. Handle whitespace appropriately around tokens
+
+Key structural patterns:
+- When parsing arrays: for each element, parse_value() and advance index by at least 1
+- When parsing objects: for each key-value pair, parse_string(), skip whitespace, parse_value(), then advance index properly
+- Always validate that indices are within bounds before accessing characters/strings
+- Implement proper error handling with meaningful messages
+
+Ensure your implementation handles complete JSON structures correctly from the start.
+"""
+
+
+def _py_block(response):
+    """Body of the first ```python fence with surrounding whitespace stripped; None if absent."""
+    _, sep, rest = response.partition("```python")
+    if not sep:
+        return None
+    code, sep, _ = rest.partition("```")
+    return code.strip() if sep else None
+
 
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
@@ -42,13 +79,14 @@ def forward(task_description, workspace_dir, test_file="test_solution.py",
     log = []
     
     # Generate solution with enhanced prompt for recursive descent parsing
-    prompt = f"""Task: {task_description}
+    prompt_base = f"""Task: {task_description}
 
 Initial code stub:
 {initial_code}
 
 Test cases:
 {test_content}"""
+    prompt = prompt_base
 
     max_attempts = 3
     attempt = 0
@@ -59,16 +97,15 @@ Test cases:
             log.append(f"LLM Response (attempt {attempt + 1}): {response[:200]}...")
             
             # Extract Python code from response
-            code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
-            if not code_match:
+            solution_code = _py_block(response)
+            if solution_code is None:
                 # Try to find any python code block (more flexible matching)
-                code_match = re.search(r'```\s*\w*\s*(.*?)\s*```', response, re.DOTALL)
-            
-            if code_match:
-                solution_code = code_match.group(1).strip()
-            else:
-                # If no code block found, use entire response as fallback
-                solution_code = response.strip()
+                code_match = _ANY_CODE_RE.search(response)
+                if code_match:
+                    solution_code = code_match.group(1).strip()
+                else:
+                    # If no code block found, use entire response as fallback
+                    solution_code = response.strip()
                 
             log.append("Code extraction successful")
             
@@ -104,12 +141,13 @@ Test cases:
         
         # Run tests with multiple Python command fallbacks
         test_result = None
-        python_commands = ['python', 'python3']
+        python_commands = [_PYTHON]
+        test_path_str = str(test_path)
         
         for cmd in python_commands:
             try:
                 result = subprocess.run(
-                    [cmd, str(test_path)],
+                    [cmd, test_path_str],
                     cwd=workspace_dir,
                     capture_output=True,
                     text=True,
@@ -168,32 +206,7 @@ Test cases:
             log.append("Detected parsing or structural issues. Retrying with enhanced recursive descent prompt...")
             
             # Enhanced prompt focusing on correct implementation patterns
-            prompt = f"""Task: {task_description}
-
-Initial code stub:
-{initial_code}
-
-Test cases:
-{test_content}
-
-IMPORTANT: For JSON parsing tasks, implement a proper recursive descent parser with these specific requirements:
-
-1. All parse functions must return (value, new_index) tuples to track position correctly
-2. Parse_object and parse_array must properly advance their index variables on each iteration 
-3. Handle commas correctly between elements in objects and arrays  
-4. Implement early termination conditions to prevent infinite recursion or loops
-5. Ensure all loop bodies actually modify loop control variables (no infinite loops)
-6. Support nested structures recursively with proper depth management
-7. Handle whitespace appropriately around tokens
-
-Key structural patterns:
-- When parsing arrays: for each element, parse_value() and advance index by at least 1
-- When parsing objects: for each key-value pair, parse_string(), skip whitespace, parse_value(), then advance index properly
-- Always validate that indices are within bounds before accessing characters/strings
-- Implement proper error handling with meaningful messages
-
-Ensure your implementation handles complete JSON structures correctly from the start.
-"""
+            prompt = prompt_base + _RETRY_SUFFIX
             attempt += 1
             continue
         else:
@@ -5,6 +5,7 @@ The forward() function is the entry point.
 """
 import subprocess
 import re
+import shutil
 from pathlib import Path
 
 
@@ -26,6 +27,36 @@ Output ONLY the reasoning steps followed by the Python code, wrapped in ```pytho
 No other text should be included.
 """
 
+_REASONING_RE = re.compile(r'Reasoning:(.*?)(?=Code:|```python|\Z)', re.DOTALL)
+_CODE_SECTION_RE = re.compile(r'Code:(.*?)(?=```python|\Z)', re.DOTALL)
+# Resolved once, keeping the old 'python' then 'python3' preference
+_PYTHON = shutil.which('python') or shutil.which('python3') or 'python3'
+
+
+# Appended to the task prompt when a retry is needed
+_RETRY_SUFFIX = """
+
+Please provide explicit step-by-step reasoning before implementing your solution.
+Your explanation should include:
+1. Analysis of the problem requirements
+2. Planning of approach including data structures and algorithms  
+3. Explanation of how you'll handle edge cases
+4. Description of implementation strategy
+
+Then write the actual Python code that implements this plan.
+
+First, think through the problem step by step."""
+
+
+def _py_block(response):
+    """Body of the first ```python fence with surrounding whitespace stripped; None if absent."""
+    _, sep, rest = response.partition("```python")
+    if not sep:
+        return None
+    code, sep, _ = rest.partition("```")
+    return code.strip() if sep else None
+
+
 def forward(task_description, workspace_dir, test_file, llm_call):
     """
     Solve a coding task with explicit reasoning before implementation.
@@ -49,10 +80,11 @@ def forward(task_description, workspace_dir, test_file, llm_call):
     log = []
     
     # Generate solution with reasoning first, then code
-    prompt = f"""Task: {task_description}
+    prompt_base = f"""Task: {task_description}
 
 Test cases:
 {test_content}"""
+    prompt = prompt_base
     
     max_attempts = 3
     attempt = 0
@@ -64,15 +96,15 @@ Test cases:
             
             # Extract reasoning and code from response
             # Look for the pattern: "Reasoning:" followed by explanation, then "Code:"
-            reasoning_match = re.search(r'Reasoning:(.*?)(?=Code:|```python|\Z)', response, re.DOTALL)
-            code_match = re.search(r'Code:(.*?)(?=```python|\Z)', response, re.DOTALL) 
+            reasoning_match = _REASONING_RE.search(response)
+            code_match = _CODE_SECTION_RE.search(response) 
             
             # If no explicit "Reasoning:" and "Code:" sections found, try to extract
             if not reasoning_match or not code_match:
                 # Try to find the Python code block directly
-                python_block = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
-                if python_block:
-                    solution_code = python_block.group(1).strip()
+                python_block = _py_block(response)
+                if python_block is not None:
+                    solution_code = python_block
                     reasoning_steps = "No explicit reasoning provided - assuming direct implementation approach"
                 else:
                     # Fallback: try to extract code from anywhere in the response
@@ -108,12 +140,13 @@ Test cases:
         
         # Run tests with multiple Python command fallbacks
         test_result = None
-        python_commands = ['python', 'python3']
+        python_commands = [_PYTHON]
+        test_path_str = str(test_path)
         
         for cmd in python_commands:
             try:
                 result = subprocess.run(
-                    [cmd, str(test_path)],
+                    [cmd, test_path_str],
                     cwd=workspace_dir,
                     capture_output=True,
                     text=True,
@@ -172,21 +205,7 @@ Test cases:
             log.append("Detected issues that require rethinking approach")
             
             # Retry with enhanced prompt to emphasize reasoning
-            prompt = f"""Task: {task_description}
-
-Test cases:
-{test_content}
-
-Please provide explicit step-by-step reasoning before implementing your solution.
-Your explanation should include:
-1. Analysis of the problem requirements
-2. Planning of approach including data structures and algorithms  
-3. Explanation of how you'll handle edge cases
-4. Description of implementation strategy
-
-Then write the actual Python code that implements this plan.
-
-First, think through the problem step by step."""
+            prompt = prompt_base + _RETRY_SUFFIX
             attempt += 1
             continue
         else:
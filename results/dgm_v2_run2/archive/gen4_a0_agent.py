@@ -4,7 +4,6 @@ This file IS the agent - DGM evolves it via patches.
 The forward() function is the entry point.
 """
 import subprocess
-import re
 from pathlib import Path
 
 
@@ -17,6 +16,15 @@ Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
 
+def _py_block(response):
+    """Body of the first ```python fence with surrounding whitespace stripped; None if absent."""
+    _, sep, rest = response.partition("```python")
+    if not sep:
+        return None
+    code, sep, _ = rest.partition("```")
+    return code.strip() if sep else None
+
+
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
     """
@@ -53,10 +61,8 @@ Test cases:
         log.append(f"LLM Response: {response[:200]}...")
         
         # Extract Python code from markdown
-        code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
-        if code_match:
-            extracted_code = code_match.group(1)
-        else:
+        extracted_code = _py_block(response)
+        if extracted_code is None:
             # If no markdown formatting found, use the entire response
             extracted_code = response.strip()
         
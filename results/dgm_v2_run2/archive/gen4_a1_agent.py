@@ -16,6 +16,17 @@ write a complete Python solution that passes all tests.
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_ANY_CODE_RE = re.compile(r'```\s*.*?python\s*(.*?)\s*```', re.DOTALL)
+
+
+def _py_block(response):
+    """Body of the first ```python fence with surrounding whitespace stripped; None if absent."""
+    _, sep, rest = response.partition("```python")
+    if not sep:
+        return None
+    code, sep, _ = rest.partition("```")
+    return code.strip() if sep else None
+
 
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
@@ -53,16 +64,15 @@ Test cases:
         log.append(f"LLM Response: {response[:200]}...")
         
         # Extract Python code from response
-        code_match = re.search(r'```python\s*(.*?)\s*```', response, re.DOTALL)
-        if not code_match:
+        solution_code = _py_block(response)
+        if solution_code is None:
             # Try to find any python code block
-            code_match = re.search(r'```\s*.*?python\s*(.*?)\s*```', response, re.DOTALL)
-        
-        if code_match:
-            solution_code = code_match.group(1).strip()
-        else:
-            # If no code block found, use the entire response as fallback
-            solution_code = response.strip()
+            code_match = _ANY_CODE_RE.search(response)
+            if code_match:
+                solution_code = code_match.group(1).strip()
+            else:
+                # If no code block found, use the entire response as fallback
+                solution_code = response.strip()
             
         log.append("Code extraction successful")
         
@@ -31,3 +31,4 @@ CREATE TABLE IF NOT EXISTS transactions (
 CREATE INDEX IF NOT EXISTS idx_agent_revenue ON agents(total_revenue DESC);
 CREATE INDEX IF NOT EXISTS idx_transactions_agent ON transactions(agent_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_created ON transactions(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_agents_status ON agents(status);
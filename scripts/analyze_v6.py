@@ -83,17 +83,16 @@ def cohens_d(a, b):
 
 def bootstrap_ci(vals, n=10000, alpha=0.05):
     """Bootstrap confidence interval."""
-    import random
+    import numpy as np
     if not vals:
         return (0, 0)
-    means = []
-    for _ in range(n):
-        sample = [random.choice(vals) for _ in range(len(vals))]
-        means.append(mean(sample))
-    means.sort()
-    lo = means[int(n * alpha/2)]
-    hi = means[int(n * (1 - alpha/2))]
-    return (lo, hi)
+    arr = np.asarray(vals, dtype=np.float64)
+    k = arr.size
+    # All n resamples at once: an (n, k) index matrix, one mean per row
+    idx = np.random.default_rng().integers(0, k, size=(n, k))
+    means = arr[idx].mean(axis=1)
+    lo, hi = np.quantile(means, [alpha/2, 1 - alpha/2])
+    return (float(lo), float(hi))
 
 def t_test(a, b):
     """Independent t-test, returns t-stat and approx p-value."""
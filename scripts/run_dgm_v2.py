@@ -8,6 +8,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.dgm_core.dgm_loop_v2 import DGMLoopV2
 
 ENDPOINT = os.environ.get("LM_STUDIO_URL", "http://172.17.0.1:1234/v1")
+# Tasks evaluated concurrently per agent; raise to match the server's parallel slots
+EVAL_WORKERS = int(os.environ.get("DGM_EVAL_WORKERS", "1"))
 TASK_IDS = ["regex_engine", "json_parser", "task_scheduler"]
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "results", "dgm_v2_code_evo")
 
@@ -20,5 +22,6 @@ if __name__ == "__main__":
         diagnose_model="qwen3-coder-30b-a3b-instruct",
         max_generations=10,
         attempts_per_generation=2,
+        eval_workers=EVAL_WORKERS,
     )
     loop.run()
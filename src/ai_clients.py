@@ -185,7 +185,7 @@ FEEDBACK: Excellent documentation and clean structure
         profiles = []
 
         for agent in agents:
-            avg_price = agent.config.total_revenue / max(1, agent.config.transaction_count)
+            avg_price = agent.config.avg_price
             success_rate = db.get_success_rate(agent.config.agent_id)
             tx_count = agent.config.transaction_count
 
@@ -4,14 +4,33 @@ Handles persistence of agents and transactions using SQLite.
 """
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# Hot-path statements shared by the single and executemany variants; one
+# SQL text means one entry in sqlite3's prepared-statement cache.
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (request_id, agent_id, code_generated,
+                              price_paid, client_name, feedback, tokens_used, api_cost)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_REVENUE_SQL = """
+    UPDATE agents
+    SET total_revenue = total_revenue + ?,
+        total_costs = total_costs + ?,
+        net_profit = total_revenue - total_costs,
+        transaction_count = transaction_count + 1
+    WHERE agent_id = ?
+"""
+
+
+@dataclass(slots=True)
 class AgentConfig:
-    """Configuration for a code-generating agent."""
+    """Configuration for a code-generating agent (slotted: no per-instance __dict__)."""
     agent_id: str
     generation: int
     parent_id: Optional[str]
@@ -22,6 +41,11 @@ class AgentConfig:
     net_profit: float = 0.0
     status: str = "active"
 
+    @property
+    def avg_price(self) -> float:
+        """Average price paid per transaction (0.0 before the first sale)."""
+        return self.total_revenue / self.transaction_count if self.transaction_count else 0.0
+
 
 @dataclass
 class Transaction:
@@ -39,17 +63,49 @@ class Transaction:
 class Database:
     """SQLite database for storing agents and transactions."""
 
-    def __init__(self, db_path: str = "celula_madre.db"):
+    def __init__(self, db_path: str = "celula_madre.db", read_only: bool = False):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            read_only: Open an existing database with mode=ro, e.g. for
+                       progress monitors reading while an experiment writes.
+                       Schema setup is skipped and writes raise.
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.read_only = read_only
+        if read_only:
+            uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
+        else:
+            self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row
-        self._init_schema()
+        self._batching = False
+        self._init_pragmas()
+        if not read_only:
+            self._init_schema()
+
+    def _init_pragmas(self):
+        """
+        Tune the connection for the write-heavy transaction loop.
+
+        WAL + synchronous=NORMAL turns each commit into a single append to
+        the log instead of two fsyncs; checkpointing is left to SQLite's
+        passive auto-checkpoint. Read-only connections only get the cache
+        settings (the journal mode is owned by the writer).
+        """
+        if not self.read_only:
+            self.conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+            """)
+        self.conn.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=1073741824;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=3000;
+        """)
 
     def _init_schema(self):
         """Initialize database schema from schema.sql file."""
@@ -58,6 +114,55 @@ class Database:
             self.conn.executescript(f.read())
         self.conn.commit()
 
+    def _commit(self):
+        """Commit unless writes are being grouped by batch()."""
+        if not self._batching:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into a single transaction.
+
+        Inside the block save/update methods skip their per-call commit;
+        one commit is issued on exit, or everything is rolled back if the
+        block raises. A nested batch() runs under a SAVEPOINT, so a failing
+        inner block discards only its own writes and the outer window keeps
+        going (one fsync per window, bad transactions still skipped).
+
+        Usage:
+            with db.batch():                      # one commit per window
+                for request in window:
+                    try:
+                        with db.batch():          # one savepoint per tx
+                            db.save_transaction(tx)
+                            db.update_agent_revenue(agent_id, price, cost)
+                    except Exception:
+                        continue
+        """
+        if self._batching:
+            self.conn.execute("SAVEPOINT batch_item")
+            try:
+                yield self
+            except BaseException:
+                self.conn.execute("ROLLBACK TO SAVEPOINT batch_item")
+                self.conn.execute("RELEASE SAVEPOINT batch_item")
+                raise
+            self.conn.execute("RELEASE SAVEPOINT batch_item")
+            return
+
+        self._batching = True
+        try:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._batching = False
+
     def save_agent(self, config: AgentConfig):
         """
         Save agent configuration to database.
@@ -72,7 +177,7 @@ class Database:
         """, (config.agent_id, config.generation, config.parent_id,
               config.system_prompt, config.total_revenue, config.transaction_count,
               config.total_costs, config.net_profit, config.status))
-        self.conn.commit()
+        self._commit()
 
     def update_agent_revenue(self, agent_id: str, revenue_delta: float, cost_delta: float = 0.0):
         """
@@ -83,15 +188,24 @@ class Database:
             revenue_delta: Amount to add to total revenue
             cost_delta: Amount to add to total costs
         """
-        self.conn.execute("""
-            UPDATE agents
-            SET total_revenue = total_revenue + ?,
-                total_costs = total_costs + ?,
-                net_profit = total_revenue - total_costs,
-                transaction_count = transaction_count + 1
-            WHERE agent_id = ?
-        """, (revenue_delta, cost_delta, agent_id))
-        self.conn.commit()
+        self.conn.execute(UPDATE_REVENUE_SQL, (revenue_delta, cost_delta, agent_id))
+        self._commit()
+
+    def update_agent_revenues(self, updates: List[Tuple[str, float, float]]):
+        """
+        Apply several revenue updates with a single executemany.
+
+        Each update counts as one transaction for its agent, exactly as
+        update_agent_revenue() would; an agent may appear more than once.
+
+        Args:
+            updates: (agent_id, revenue_delta, cost_delta) tuples
+        """
+        self.conn.executemany(UPDATE_REVENUE_SQL, [
+            (revenue_delta, cost_delta, agent_id)
+            for agent_id, revenue_delta, cost_delta in updates
+        ])
+        self._commit()
 
     def save_transaction(self, tx: Transaction):
         """
@@ -100,13 +214,21 @@ class Database:
         Args:
             tx: Transaction to save
         """
-        self.conn.execute("""
-            INSERT INTO transactions (request_id, agent_id, code_generated,
-                                      price_paid, client_name, feedback, tokens_used, api_cost)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (tx.request_id, tx.agent_id, tx.code_generated,
+        self.conn.execute(INSERT_TRANSACTION_SQL, (tx.request_id, tx.agent_id, tx.code_generated,
               tx.price_paid, tx.client_name, tx.feedback, tx.tokens_used, tx.api_cost))
-        self.conn.commit()
+        self._commit()
+
+    def save_transactions(self, txs: List[Transaction]):
+        """
+        Save several transaction records with a single executemany.
+
+        Args:
+            txs: Transactions to save
+        """
+        self.conn.executemany(INSERT_TRANSACTION_SQL, [(tx.request_id, tx.agent_id, tx.code_generated,
+               tx.price_paid, tx.client_name, tx.feedback, tx.tokens_used, tx.api_cost)
+              for tx in txs])
+        self._commit()
 
     def get_all_agents(self) -> List[AgentConfig]:
         """
@@ -119,7 +241,28 @@ class Database:
             "SELECT * FROM agents ORDER BY total_revenue DESC"
         ).fetchall()
 
-        return [AgentConfig(
+        return [self._row_to_config(row) for row in rows]
+
+    def get_active_agents(self) -> List[AgentConfig]:
+        """
+        Retrieve only active agents ordered by revenue (highest first).
+
+        Uses idx_agents_status, so resuming a long run does not load every
+        retired agent just to filter it out in Python.
+
+        Returns:
+            List of active agent configurations
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM agents WHERE status = 'active' ORDER BY total_revenue DESC"
+        ).fetchall()
+
+        return [self._row_to_config(row) for row in rows]
+
+    @staticmethod
+    def _row_to_config(row: sqlite3.Row) -> AgentConfig:
+        """Build an AgentConfig from an agents table row."""
+        return AgentConfig(
             agent_id=row['agent_id'],
             generation=row['generation'],
             parent_id=row['parent_id'],
@@ -129,7 +272,80 @@ class Database:
             total_costs=row['total_costs'],
             net_profit=row['net_profit'],
             status=row['status']
-        ) for row in rows]
+        )
+
+    def get_top_agents(self, limit: int = 3) -> List[AgentConfig]:
+        """
+        Retrieve the most profitable agents, sorted by SQLite.
+
+        Args:
+            limit: Maximum number of agents to return
+
+        Returns:
+            List of agent configurations ordered by net profit (highest first)
+        """
+        rows = self.conn.execute("""
+            SELECT * FROM agents
+            ORDER BY net_profit DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+
+        return [self._row_to_config(row) for row in rows]
+
+    def get_gen_tx_distribution(self) -> List[Tuple[int, int]]:
+        """
+        Get transaction counts aggregated by generation.
+
+        Returns:
+            List of (generation, total transactions) tuples, oldest generation first
+        """
+        rows = self.conn.execute("""
+            SELECT generation, SUM(transaction_count) AS tx_count
+            FROM agents
+            GROUP BY generation
+            ORDER BY generation
+        """).fetchall()
+
+        return [(row['generation'], row['tx_count']) for row in rows]
+
+    def get_generation_stats(self) -> Dict[int, Dict[str, float]]:
+        """
+        Aggregate revenue, costs and transactions per generation.
+
+        Replaces building per-generation totals in a Python loop over every
+        AgentConfig: SQLite does the grouping and only one row per
+        generation comes back.
+
+        Returns:
+            Dict mapping generation to its 'agents', 'total_rev',
+            'total_cost', 'total_txs', 'avg_rev' (per agent), 'avg_price'
+            (per transaction) and 'avg_profit' (per agent)
+        """
+        rows = self.conn.execute("""
+            SELECT generation,
+                   COUNT(*) AS agents,
+                   SUM(total_revenue) AS total_rev,
+                   SUM(total_costs) AS total_cost,
+                   SUM(transaction_count) AS total_txs
+            FROM agents
+            GROUP BY generation
+            ORDER BY generation
+        """).fetchall()
+
+        stats = {}
+        for row in rows:
+            agents, total_rev, total_cost, total_txs = (
+                row['agents'], row['total_rev'], row['total_cost'], row['total_txs'])
+            stats[row['generation']] = {
+                'agents': agents,
+                'total_rev': total_rev,
+                'total_cost': total_cost,
+                'total_txs': total_txs,
+                'avg_rev': total_rev / agents,
+                'avg_price': total_rev / max(1, total_txs),
+                'avg_profit': (total_rev - total_cost) / agents,
+            }
+        return stats
 
     def get_recent_feedback(self, agent_id: str, limit: int = 5) -> List[str]:
         """
@@ -186,6 +402,47 @@ class Database:
         result = self.conn.execute(query, (agent_id,)).fetchone()
         return result['lineage_revenue'] or 0.0
 
+    def get_lineage_revenues(self, agent_ids: List[str]) -> Dict[str, float]:
+        """
+        Calculate lineage revenue (CMP) for several agents in one query.
+
+        Equivalent to calling get_lineage_revenue() per agent, but walks all
+        clades in a single recursive CTE so parent selection does not issue
+        one query per candidate.
+
+        Args:
+            agent_ids: IDs of agents to score
+
+        Returns:
+            Dict mapping each agent_id to its lineage revenue (0.0 if unknown)
+        """
+        if not agent_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in agent_ids)
+        query = f"""
+            WITH RECURSIVE lineage(root_id, agent_id) AS (
+                SELECT agent_id, agent_id
+                FROM agents
+                WHERE agent_id IN ({placeholders})
+
+                UNION ALL
+
+                SELECT l.root_id, a.agent_id
+                FROM agents a
+                INNER JOIN lineage l ON a.parent_id = l.agent_id
+            )
+            SELECT l.root_id, SUM(a.total_revenue) as lineage_revenue
+            FROM lineage l
+            INNER JOIN agents a ON a.agent_id = l.agent_id
+            GROUP BY l.root_id
+        """
+
+        scores = dict.fromkeys(agent_ids, 0.0)
+        for row in self.conn.execute(query, list(agent_ids)).fetchall():
+            scores[row['root_id']] = row['lineage_revenue'] or 0.0
+        return scores
+
     def get_avg_code_length(self, agent_id: str) -> float:
         """
         Get average code length (lines) for an agent.
@@ -317,13 +574,19 @@ class Database:
             SET status = ?
             WHERE agent_id = ?
         """, (status, agent_id))
-        self.conn.commit()
+        self._commit()
 
     def get_transaction_count_total(self) -> int:
         """Get total number of transactions in database."""
         result = self.conn.execute("SELECT COUNT(*) as count FROM transactions").fetchone()
         return result['count'] if result else 0
 
+    def optimize(self):
+        """Refresh query planner statistics (also run by close() on writers)."""
+        self.conn.execute("PRAGMA optimize")
+
     def close(self):
-        """Close database connection."""
+        """Close database connection, refreshing planner statistics first."""
+        if not self.read_only:
+            self.optimize()
         self.conn.close()
@@ -0,0 +1,98 @@
+"""
+Long-lived pytest worker started by runner.py (`python -m ..._pytest_server`).
+
+Imports pytest and loads its plugins once, prints the address of a Unix
+socket on stdout, then forks one child per connection. Each child reports
+its pid, runs pytest in the requested workspace and sends back
+(output, returncode). Being its own entry point, the server never imports
+the caller's __main__ script, so children fork from a small interpreter.
+
+The server exits when its stdin is closed, i.e. when the parent goes away.
+"""
+import contextlib
+import io
+import os
+import selectors
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+from multiprocessing.connection import Connection
+
+import pytest
+
+from .runner import _CappedOutput
+
+
+def _warm():
+    """Collect an empty directory so entry-point plugins are loaded and rewritten."""
+    empty = tempfile.mkdtemp(prefix="dgm_pytest_warm_")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            pytest.main(["--collect-only", "-q", "-p", "no:cacheprovider", empty])
+    finally:
+        shutil.rmtree(empty, ignore_errors=True)
+
+
+def _serve(conn):
+    """Child side of one request; never returns."""
+    status = 1
+    try:
+        test_file, workspace_dir = conn.recv()
+        os.chdir(workspace_dir)
+        sys.path.insert(0, workspace_dir)
+        # Setup succeeded: from here on a dead child means the tests killed it
+        conn.send(os.getpid())
+        buf = _CappedOutput()
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            code = pytest.main([test_file, "-v", "--tb=short"])
+        conn.send((buf.getvalue(), int(code)))
+        status = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        os._exit(status)
+
+
+def main():
+    _warm()
+    tmpdir = tempfile.mkdtemp(prefix="dgm_pytest_server_")
+    address = os.path.join(tmpdir, "socket")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+    listener.listen()
+    # Children are never waited on; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    print(address, flush=True)
+    # Nothing else may write into the pipe the parent stopped reading
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 1)
+
+    sel = selectors.DefaultSelector()
+    sel.register(listener, selectors.EVENT_READ)
+    sel.register(0, selectors.EVENT_READ)
+    try:
+        while True:
+            for key, _ in sel.select():
+                if key.fileobj == 0:
+                    if not os.read(0, 4096):
+                        return
+                    continue
+                sock, _ = listener.accept()
+                if os.fork() == 0:
+                    sel.close()
+                    listener.close()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    os.dup2(devnull, 0)
+                    _serve(Connection(sock.detach()))
+                sock.close()
+    finally:
+        listener.close()
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
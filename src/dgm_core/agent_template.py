@@ -16,6 +16,8 @@ write a complete Python solution that passes all tests.
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_PY_CODE_RE = re.compile(r'```python\s*\n(.*?)\n```', re.DOTALL)
+
 
 def forward(task_description, workspace_dir, test_file="test_solution.py",
             llm_call=None):
@@ -73,10 +75,14 @@ Write the complete solution.py content."""
 
 def extract_code(response):
     """Extract Python code from LLM response."""
-    pattern = r'```python\s*\n(.*?)\n```'
-    matches = re.findall(pattern, response, re.DOTALL)
-    if matches:
-        return max(matches, key=len)
+    # Longest fenced block, tracked without materializing every match
+    best = None
+    for match in _PY_CODE_RE.finditer(response):
+        code = match.group(1)
+        if best is None or len(code) > len(best):
+            best = code
+    if best is not None:
+        return best
     if "def " in response or "class " in response:
         return response
     return None
@@ -86,10 +92,11 @@ def run_tests(workspace_dir, test_file="test_solution.py"):
     """Run pytest and return output."""
     try:
         result = subprocess.run(
-            ["python3", "-m", "pytest", test_file, "-v", "--tb=short"],
-            cwd=workspace_dir, capture_output=True, text=True, timeout=30,
+            ["python3", "-m", "pytest", test_file, "-q", "--no-header", "--tb=line"],
+            cwd=workspace_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, timeout=30,
         )
-        return result.stdout + result.stderr
+        return result.stdout
     except subprocess.TimeoutExpired:
         return "TIMEOUT: Tests took too long"
     except Exception as e:
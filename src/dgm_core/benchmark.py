@@ -59,13 +59,12 @@ def setup_task_workspace(task, workspace_dir):
 
 
 def evaluate_task(workspace_dir, task, timeout=60):
+    # Imported here so `python benchmark.py` (create_sample_tasks) still runs as a script
+    from .runner import WorkerError, run_pytest
+
     test_file = task.get("test_file", "test_solution.py")
     try:
-        result = subprocess.run(
-            ["python3", "-m", "pytest", test_file, "-v", "--tb=short"],
-            cwd=workspace_dir, capture_output=True, text=True, timeout=timeout,
-        )
-        output = result.stdout + result.stderr
+        output, returncode = run_pytest(test_file, workspace_dir, timeout=timeout)
         passed = 0
         failed = 0
         for line in output.split("\n"):
@@ -80,10 +79,13 @@ def evaluate_task(workspace_dir, task, timeout=60):
         score = passed / total if total > 0 else 0.0
         return {
             "passed": passed, "failed": failed, "total": total,
-            "score": score, "output": output[:5000], "returncode": result.returncode,
+            "score": score, "output": output[:5000], "returncode": returncode,
         }
     except subprocess.TimeoutExpired:
         return {"passed": 0, "failed": 0, "total": 0, "score": 0.0, "output": "TIMEOUT", "returncode": -1}
+    except WorkerError:
+        # Harness failure, not a failing solution: don't score it
+        raise
     except Exception as e:
         return {"passed": 0, "failed": 0, "total": 0, "score": 0.0, "output": str(e), "returncode": -1}
 
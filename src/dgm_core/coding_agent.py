@@ -6,7 +6,10 @@ Two modes:
 """
 import os
 import re
+from pathlib import Path
+
 from .llm import chat, chat_with_tools, create_client
+from .runner import WorkerError, run_pytest
 from .tools import TOOL_DEFINITIONS, execute_tool
 
 
@@ -20,6 +23,13 @@ write a complete Python solution that passes all tests.
 Output ONLY the Python code, wrapped in ```python ... ```.
 No explanations."""
 
+_PY_CODE_RE = re.compile(r'```python\s*\n(.*?)\n```', re.DOTALL)
+_DIRECT_PROMPT_RE = re.compile(r'DIRECT_SYSTEM_PROMPT\s*=\s*"""(.*?)"""', re.DOTALL)
+_AGENT_PROMPT_RE = re.compile(r'AGENT_SYSTEM_PROMPT\s*=\s*"""(.*?)"""', re.DOTALL)
+
+# This file is the agent's own code; read it once rather than per candidate
+_SOURCE = Path(__file__).read_text()
+
 DIRECT_FIX_PROMPT = """Your previous solution failed some tests. Fix it.
 
 Previous solution:
@@ -57,9 +67,6 @@ class CodingAgent:
     
     def _forward_direct(self, task_description, workspace_dir, test_file):
         """Direct mode: LLM generates solution code directly."""
-        import subprocess
-        from pathlib import Path
-        
         # Read test file for context
         test_path = Path(workspace_dir) / test_file
         test_content = test_path.read_text() if test_path.exists() else ""
@@ -111,18 +118,16 @@ Write the complete solution.py content."""
             
             # Run tests
             try:
-                result = subprocess.run(
-                    ["python3", "-m", "pytest", test_file, "-v", "--tb=short"],
-                    cwd=workspace_dir, capture_output=True, text=True, timeout=30,
-                )
-                test_output = result.stdout + result.stderr
+                test_output, returncode = run_pytest(test_file, workspace_dir, timeout=30)
                 self.log.append({"tool": "test", "args": {"attempt": attempt},
                                "result": test_output[:1000]})
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.log.append({"tool": "success", "args": {"attempt": attempt},
                                    "result": "All tests passed!"})
                     break
+            except WorkerError:
+                raise
             except Exception as e:
                 test_output = str(e)
                 self.log.append({"tool": "test", "args": {"attempt": attempt},
@@ -156,37 +161,38 @@ Edit solution.py to pass all tests. Run: cd {workspace_dir} && python3 -m pytest
     
     def _extract_code(self, response):
         """Extract Python code from LLM response."""
-        pattern = r'```python\s*\n(.*?)\n```'
-        matches = re.findall(pattern, response, re.DOTALL)
-        if matches:
-            return max(matches, key=len)
+        # Longest fenced block, tracked without materializing every match
+        best = None
+        for match in _PY_CODE_RE.finditer(response):
+            code = match.group(1)
+            if best is None or len(code) > len(best):
+                best = code
+        if best is not None:
+            return best
         # Fallback: if response looks like code, use it directly
         if "def " in response or "class " in response:
             return response
         return None
     
     def get_log_text(self):
-        lines = []
-        for entry in self.log:
-            lines.append(f"[{entry['tool']}] {str(entry['args'])[:80]}")
-            lines.append(f"  {entry['result'][:300]}")
-            lines.append("")
-        return "\n".join(lines)
+        return "\n".join(
+            f"[{entry['tool']}] {str(entry['args'])[:80]}\n  {entry['result'][:300]}\n"
+            for entry in self.log
+        )
     
     def get_source_code(self):
-        return open(__file__).read()
+        return _SOURCE
 
 
 def get_default_agent_code():
-    return open(__file__).read()
+    return _SOURCE
 
 
 def load_agent_from_code(code):
     """Load agent configuration from code string. Returns CodingAgent with extracted prompt."""
-    import re
     # Extract system prompt from code
-    match = re.search(r'DIRECT_SYSTEM_PROMPT\s*=\s*"""(.*?)"""', code, re.DOTALL)
+    match = _DIRECT_PROMPT_RE.search(code)
     if not match:
-        match = re.search(r'AGENT_SYSTEM_PROMPT\s*=\s*"""(.*?)"""', code, re.DOTALL)
+        match = _AGENT_PROMPT_RE.search(code)
     prompt = match.group(1) if match else None
     return CodingAgent(system_prompt=prompt)
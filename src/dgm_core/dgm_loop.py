@@ -14,6 +14,7 @@ from .llm import create_client, AGENT_MODEL, DIAGNOSE_MODEL
 from .selection import score_child_prop, random_selection
 from .diagnose import diagnose_failure, implement_improvement
 from .benchmark import load_task, setup_task_workspace, evaluate_task, get_task_ids
+from .runner import WorkerError
 from .coding_agent import CodingAgent, get_default_agent_code, load_agent_from_code
 
 
@@ -149,6 +150,9 @@ class DGMLoop:
                     sol_file = workspace / task.get("code_file", "solution.py")
                     result["agent_solution"] = sol_file.read_text() if sol_file.exists() else ""
                     
+                except WorkerError:
+                    # The test harness broke; a 0.0 score here would mislead selection
+                    raise
                 except Exception as e:
                     result = {
                         "passed": 0, "failed": 0, "total": 0,
@@ -14,11 +14,13 @@ import shutil
 import tempfile
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from .llm import create_client, chat, MAX_TOKENS
 from .benchmark import load_task, setup_task_workspace, evaluate_task, get_task_ids
+from .runner import WorkerError
 from .selection import score_child_prop, random_selection
 
 
@@ -133,6 +135,9 @@ def execute_agent(agent_code, task, agent_model=AGENT_MODEL, endpoint=None):
             eval_result["agent_solution"] = result.get("solution", "")
             return eval_result
             
+        except WorkerError:
+            # The test harness broke; a 0.0 score here would mislead selection
+            raise
         except Exception as e:
             return {
                 "passed": 0, "failed": 0, "total": 0,
@@ -352,7 +357,13 @@ class DGMLoopV2:
     def __init__(self, output_dir, task_ids=None, endpoint=None,
                  agent_model=None, diagnose_model=None,
                  selection_method="score_child_prop",
-                 max_generations=20, attempts_per_generation=2):
+                 max_generations=20, attempts_per_generation=2, eval_workers=1):
+        """
+        eval_workers: tasks evaluated concurrently per agent. Each task's
+        LLM calls are independent, so with a batching inference server
+        (vLLM, llama.cpp -np, LM Studio parallel slots) they decode together
+        instead of queueing behind each other. 1 = sequential.
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.task_ids = task_ids or get_task_ids()
@@ -362,6 +373,7 @@ class DGMLoopV2:
         self.selection_method = selection_method
         self.max_generations = max_generations
         self.attempts_per_generation = attempts_per_generation
+        self.eval_workers = eval_workers
         
         self.archive = Archive(self.output_dir / "archive")
         # Strong model client for diagnosis
@@ -381,18 +393,22 @@ class DGMLoopV2:
     
     def _evaluate_agent(self, agent_code):
         """Evaluate agent on all tasks. Returns {task_id: result}, score."""
-        results = {}
-        total = 0.0
-        
-        for tid in self.task_ids:
-            task = load_task(tid)
-            result = execute_agent(
-                agent_code, task,
+        def run_task(tid):
+            return execute_agent(
+                agent_code, load_task(tid),
                 agent_model=self.agent_model,
                 endpoint=self.endpoint,
             )
-            results[tid] = result
-            total += result["score"]
+        
+        # Each task runs in its own temp workspace, so tasks can overlap
+        if self.eval_workers > 1 and len(self.task_ids) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.eval_workers, len(self.task_ids))) as pool:
+                task_results = list(pool.map(run_task, self.task_ids))
+        else:
+            task_results = [run_task(tid) for tid in self.task_ids]
+        
+        results = dict(zip(self.task_ids, task_results))
+        total = sum(r["score"] for r in task_results)
         
         score = total / len(self.task_ids) if self.task_ids else 0.0
         return results, score
@@ -0,0 +1,125 @@
+"""
+Test runner for DGM workspaces.
+
+pytest and its plugins are loaded once in a long-lived server process (see
+_pytest_server.py); each run forks a fresh child from it. Runs skip
+interpreter startup and plugin loading, but still get a clean copy of
+sys.modules, so an edited solution.py is always re-imported. The server is
+started with `python -m`, so children never carry the caller's imports.
+"""
+import io
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Client
+from pathlib import Path
+
+_SERVER = None
+_ADDRESS = None
+_LOCK = threading.Lock()
+
+# Output kept per run: the head carries the per-test lines callers slice,
+# the tail carries the "N passed, M failed" summary.
+HEAD_CHARS = 20000
+TAIL_CHARS = 20000
+
+
+class _CappedOutput(io.TextIOBase):
+    """Text sink holding the first head and last tail characters written."""
+
+    def __init__(self, head=HEAD_CHARS, tail=TAIL_CHARS):
+        self._head = []
+        self._head_room = head
+        self._tail = deque()
+        self._tail_len = 0
+        self._tail_cap = tail
+        self._dropped = 0
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        n = len(s)
+        if self._head_room:
+            part = s[:self._head_room]
+            self._head.append(part)
+            self._head_room -= len(part)
+            s = s[len(part):]
+        if s:
+            self._tail.append(s)
+            self._tail_len += len(s)
+            while self._tail_len - len(self._tail[0]) >= self._tail_cap:
+                self._dropped += len(self._tail[0])
+                self._tail_len -= len(self._tail.popleft())
+        return n
+
+    def getvalue(self):
+        tail = "".join(self._tail)
+        dropped = self._dropped + max(0, len(tail) - self._tail_cap)
+        if dropped:
+            tail = f"\n... [{dropped} chars truncated] ...\n" + tail[-self._tail_cap:]
+        return "".join(self._head) + tail
+
+
+class WorkerError(RuntimeError):
+    """The test worker failed before running the tests (not a test result)."""
+
+
+def _server_address():
+    global _SERVER, _ADDRESS
+    with _LOCK:
+        if _SERVER is None or _SERVER.poll() is not None:
+            root = str(Path(__file__).resolve().parents[__package__.count(".") + 1])
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+            # The server exits when this stdin pipe closes, i.e. with us
+            _SERVER = subprocess.Popen(
+                [sys.executable, "-m", f"{__package__}._pytest_server"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+            )
+            _ADDRESS = _SERVER.stdout.readline().decode().strip()
+            _SERVER.stdout.close()
+            if not _ADDRESS:
+                _SERVER.wait()
+                raise WorkerError(f"pytest server failed to start (exit code {_SERVER.returncode})")
+        return _ADDRESS
+
+
+def run_pytest(test_file, workspace_dir, timeout=30):
+    """
+    Run pytest on test_file inside workspace_dir.
+
+    Returns (output, returncode) like `python3 -m pytest test_file -v
+    --tb=short` with stdout and stderr combined, keeping at most the first
+    HEAD_CHARS and last TAIL_CHARS characters. Raises
+    subprocess.TimeoutExpired if the run exceeds timeout (the child is
+    killed), so callers can keep their subprocess error handling. Raises
+    WorkerError if the worker dies before it starts the tests.
+    """
+    conn = Client(_server_address(), family="AF_UNIX")
+    deadline = time.monotonic() + timeout
+    try:
+        conn.send((test_file, str(workspace_dir)))
+        try:
+            if not conn.poll(timeout):
+                raise WorkerError("pytest worker did not start")
+            pid = conn.recv()
+        except EOFError:
+            raise WorkerError("pytest worker died during setup (traceback on stderr)") from None
+        if not conn.poll(max(0, deadline - time.monotonic())):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            raise subprocess.TimeoutExpired(["pytest", test_file], timeout)
+        try:
+            return conn.recv()
+        except EOFError:
+            # The tests took the child down (e.g. os._exit in the solution)
+            return "pytest worker exited before reporting", 1
+    finally:
+        conn.close()
@@ -1,8 +1,10 @@
 """
 Tools for the coding agent - bash + editor (same as DGM)
 """
+import selectors
 import subprocess
 import os
+import time
 from pathlib import Path
 
 TOOL_DEFINITIONS = [
@@ -52,43 +54,88 @@ TOOL_DEFINITIONS = [
 ]
 
 
-def execute_tool(tool_name, tool_args, workdir=None, timeout=120):
-    """Execute a tool and return the result string."""
+def execute_tool(tool_name, tool_args, workdir=None, timeout=120, max_chars=10000):
+    """Execute a tool and return the result string (at most max_chars long)."""
     if tool_name == "bash":
-        return _run_bash(tool_args.get("command", ""), workdir=workdir, timeout=timeout)
+        return _run_bash(tool_args.get("command", ""), workdir=workdir, timeout=timeout,
+                         max_chars=max_chars)
     elif tool_name == "editor":
         return _run_editor(
             tool_args.get("command", "view"),
             tool_args.get("path", ""),
             tool_args.get("file_text"),
+            max_chars=max_chars,
         )
     else:
         return f"Error: Unknown tool '{tool_name}'"
 
 
-def _run_bash(command, workdir=None, timeout=120):
+def _run_capped(cmd, cwd=None, timeout=120, max_chars=10000):
+    """
+    Run cmd and return (stdout, stderr, returncode), keeping only the first
+    max_chars of each stream. The rest is read and discarded as it arrives,
+    so a command that prints without end cannot fill memory before the
+    timeout. Raises subprocess.TimeoutExpired after killing the process.
+    """
+    # 4 bytes per char so multi-byte UTF-8 still yields max_chars characters
+    cap = max_chars * 4
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    kept = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        for stream in kept:
+            sel.register(stream, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+                buf = kept[key.fileobj]
+                if len(buf) < cap:
+                    buf += chunk[:cap - len(buf)]
+    try:
+        returncode = proc.wait(max(0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    # Decode like text=True would, including universal newlines
+    stdout, stderr = (
+        kept[s].decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")[:max_chars]
+        for s in (proc.stdout, proc.stderr)
+    )
+    return stdout, stderr, returncode
+
+
+def _run_bash(command, workdir=None, timeout=120, max_chars=10000):
     if not command.strip():
         return "Error: empty command"
     try:
-        result = subprocess.run(
-            ["bash", "-c", command],
-            capture_output=True, text=True, timeout=timeout, cwd=workdir,
+        stdout, stderr, returncode = _run_capped(
+            ["bash", "-c", command], cwd=workdir, timeout=timeout, max_chars=max_chars,
         )
         output = ""
-        if result.stdout:
-            output += result.stdout
-        if result.stderr:
-            output += ("\nSTDERR:\n" if output else "STDERR:\n") + result.stderr
+        if stdout:
+            output += stdout
+        if stderr:
+            output += ("\nSTDERR:\n" if output else "STDERR:\n") + stderr
         if not output:
-            output = f"(exit code: {result.returncode})"
-        return output[:10000]
+            output = f"(exit code: {returncode})"
+        return output[:max_chars]
     except subprocess.TimeoutExpired:
         return f"Error: command timed out after {timeout}s"
     except Exception as e:
         return f"Error: {e}"
 
 
-def _run_editor(command, path, file_text=None):
+def _run_editor(command, path, file_text=None, max_chars=10000):
     try:
         path_obj = Path(path)
 
@@ -98,12 +145,15 @@ def _run_editor(command, path, file_text=None):
                     ["find", str(path_obj), "-maxdepth", "2", "-not", "-path", "*/\\.*"],
                     capture_output=True, text=True
                 )
-                return result.stdout[:10000]
+                return result.stdout[:max_chars]
             elif path_obj.is_file():
-                content = path_obj.read_text()
+                # Numbering only lengthens lines, so the first max_chars
+                # characters of the file are enough to fill the output.
+                with open(path_obj) as f:
+                    content = f.read(max_chars)
                 lines = content.split("\n")
                 numbered = [f"{i+1:6}\t{line}" for i, line in enumerate(lines)]
-                return "\n".join(numbered)[:10000]
+                return "\n".join(numbered)[:max_chars]
             else:
                 return f"Error: {path} does not exist"
 
@@ -258,10 +258,10 @@ with open('{tmpdir}/solution.py', 'w') as f:
             
             agent_result = subprocess.run(
                 ["python3", run_file],
-                capture_output=True, text=True, timeout=timeout,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=timeout,
                 cwd=tmpdir,
             )
-            agent_output = agent_result.stdout + agent_result.stderr
+            agent_output = agent_result.stdout
         except subprocess.TimeoutExpired:
             return {"passed": False, "output": "", "error": "Agent timeout"}
         except Exception as e:
@@ -271,14 +271,14 @@ with open('{tmpdir}/solution.py', 'w') as f:
         try:
             test_result = subprocess.run(
                 ["python3", "-m", "pytest", test_file, "-v", "--tb=short"],
-                capture_output=True, text=True, timeout=timeout,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=timeout,
                 cwd=tmpdir,
             )
             passed = test_result.returncode == 0
             return {
                 "passed": passed,
                 "output": agent_output,
-                "test_output": test_result.stdout + test_result.stderr,
+                "test_output": test_result.stdout,
                 "error": "" if passed else "Tests failed",
             }
         except subprocess.TimeoutExpired:
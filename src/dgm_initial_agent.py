@@ -13,6 +13,16 @@ LLM_ENDPOINT = os.getenv("LLM_ENDPOINT", "http://172.17.0.1:1234/v1")
 LLM_MODEL = os.getenv("LLM_MODEL", "qwen3-coder-30b-a3b-instruct")
 LLM_API_KEY = os.getenv("LLM_API_KEY", "lm-studio")
 
+_CLIENT = None
+
+
+def _get_client():
+    """Shared client so repeated solve() calls reuse one HTTP connection pool."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OpenAI(base_url=LLM_ENDPOINT, api_key=LLM_API_KEY)
+    return _CLIENT
+
 
 def solve(task_description: str, initial_code: str) -> str:
     """
@@ -25,7 +35,7 @@ def solve(task_description: str, initial_code: str) -> str:
     Returns:
         Complete Python code that solves the task
     """
-    client = OpenAI(base_url=LLM_ENDPOINT, api_key=LLM_API_KEY)
+    client = _get_client()
     
     prompt = f"""Solve the following coding task. Return ONLY the Python code, no explanations.
 
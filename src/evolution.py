@@ -82,11 +82,8 @@ class EvolutionaryEngine:
             Selected parent agent
         """
         if random.random() < 0.8:
-            lineage_scores = {
-                agent: db.get_lineage_revenue(agent.config.agent_id)
-                for agent in agents
-            }
-            return max(lineage_scores, key=lineage_scores.get)
+            lineage_scores = db.get_lineage_revenues([a.config.agent_id for a in agents])
+            return max(agents, key=lambda a: lineage_scores[a.config.agent_id])
         else:
             return random.choice(agents)
 
@@ -165,7 +162,7 @@ Return ONLY the new prompt, no explanation."""
         performance_data = {
             'total_revenue': parent.config.total_revenue,
             'transaction_count': parent.config.transaction_count,
-            'avg_price': parent.config.total_revenue / max(1, parent.config.transaction_count),
+            'avg_price': parent.config.avg_price,
             'feedback_samples': '\n'.join([f"- {f}" for f in feedback]) if feedback else "- No feedback yet"
         }
 
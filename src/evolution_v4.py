@@ -11,6 +11,7 @@ Key changes:
 
 import os
 import random
+from operator import itemgetter
 from typing import List, Tuple, Optional
 from dotenv import load_dotenv
 load_dotenv()
@@ -104,11 +105,8 @@ class EvolutionV4:
 
         # Parent 1: CMP selection (80% best lineage, 20% random)
         if random.random() < 0.8:
-            lineage_scores = {
-                agent: db.get_lineage_revenue(agent.config.agent_id)
-                for agent in agents
-            }
-            parent1 = max(lineage_scores, key=lineage_scores.get)
+            lineage_scores = db.get_lineage_revenues([a.config.agent_id for a in agents])
+            parent1 = max(agents, key=lambda a: lineage_scores[a.config.agent_id])
         else:
             parent1 = random.choice(agents)
 
@@ -142,8 +140,8 @@ class EvolutionV4:
         - High-performing parents → low temperature (preserve)
         - Low-performing parents → high temperature (explore)
         """
-        p1_avg = parent1.config.total_revenue / max(1, parent1.config.transaction_count)
-        p2_avg = parent2.config.total_revenue / max(1, parent2.config.transaction_count)
+        p1_avg = parent1.config.avg_price
+        p2_avg = parent2.config.avg_price
         combined_avg = (p1_avg + p2_avg) / 2
 
         # Adaptive temperature: high performers → conservative, low → aggressive
@@ -195,6 +193,11 @@ Return ONLY the new system prompt, nothing else."""
 
     def find_weakest(self, agents: List[SimpleAgent], db: Database) -> Optional[SimpleAgent]:
         """Find the weakest agent for replacement (competitive exclusion)."""
+        weakest = self._weakest_with_avg(agents)
+        return weakest[0] if weakest else None
+
+    def _weakest_with_avg(self, agents: List[SimpleAgent]) -> Optional[Tuple[SimpleAgent, float]]:
+        """Weakest agent together with the avg price it was ranked by."""
         if len(agents) <= MIN_POPULATION:
             return None
         
@@ -202,14 +205,13 @@ Return ONLY the new system prompt, nothing else."""
         for agent in agents:
             if agent.config.transaction_count < 3:
                 continue  # Don't kill newborns
-            avg_price = agent.config.total_revenue / agent.config.transaction_count
-            scored.append((agent, avg_price))
+            scored.append((agent, agent.config.avg_price))
         
         if not scored:
             return None
         
-        scored.sort(key=lambda x: x[1])
-        return scored[0][0]
+        # Keys are precomputed above; a single min() pass replaces the full sort
+        return min(scored, key=itemgetter(1))
 
     def check_starvation(self, agents: List[SimpleAgent], tx_number: int, db: Database) -> List[SimpleAgent]:
         """Kill agents that haven't been selected in too long (market voted them out)."""
@@ -231,11 +233,13 @@ Return ONLY the new system prompt, nothing else."""
         
         # Population cap: only evolve if under limit OR can replace someone
         if len(active) >= MAX_POPULATION:
-            weakest = self.find_weakest(active, db)
-            if weakest:
+            found = self._weakest_with_avg(active)
+            if found:
+                # Reuse the avg price computed for ranking instead of redoing it
+                weakest, avg_p = found
                 weakest.config.status = "retired"
                 db.update_agent_status(weakest.config.agent_id, "retired")
-                avg_p = weakest.config.total_revenue / max(1, weakest.config.transaction_count)
+                active.remove(weakest)
                 print(f"  ⚔️  REPLACED: {weakest.config.agent_id} "
                       f"(avg ${avg_p:.2f}, weakest in population)")
 
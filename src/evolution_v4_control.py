@@ -19,8 +19,13 @@ from src.agent import PROVIDER
 class EvolutionV4Control:
     """Random evolutionary engine (control group)."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Optional seed for this engine's private RNG (reproducible runs).
+        """
         self.provider = PROVIDER
+        self.rng = random.Random(seed)
 
         if self.provider == "local":
             from openai import OpenAI
@@ -82,7 +87,7 @@ class EvolutionV4Control:
             "take_b",     # Mostly B with random changes
             "scramble",   # Random pieces from both
         ]
-        strategy = random.choice(strategies)
+        strategy = self.rng.choice(strategies)
 
         mutation_prompt = f"""You are a prompt editor. Combine and modify these two coding agent prompts into a NEW prompt.
 
@@ -10,6 +10,7 @@ import random
 import time
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -73,8 +74,12 @@ class Agent:
     dev_trajectories: list[dict] = field(default_factory=list)
 
 
-def predict(agent: Agent, example: MarketExample, llm_kwargs: dict = {}) -> dict:
-    """Run agent on a single example. Returns prediction dict."""
+def predict(agent: Agent, example: MarketExample, llm_kwargs: dict = {},
+            rng: Optional[random.Random] = None) -> dict:
+    """Run agent on a single example. Returns prediction dict.
+
+    rng breaks UP/DOWN ties in unparseable responses (module random if None).
+    """
     user_msg = (
         f"{example.context}\n\n"
         "Respond with ONLY 'UP' or 'DOWN' followed by a brief reason (max 50 words).\n"
@@ -102,7 +107,7 @@ def predict(agent: Agent, example: MarketExample, llm_kwargs: dict = {}) -> dict
         elif "DOWN" in response_upper and "UP" not in response_upper:
             predicted = "DOWN"
         else:
-            predicted = random.choice(["UP", "DOWN"])  # Fallback
+            predicted = (rng or random).choice(["UP", "DOWN"])  # Fallback
     
     correct = predicted == example.direction
     
@@ -121,18 +126,36 @@ def evaluate_batch(
     examples: list[MarketExample],
     llm_kwargs: dict = {},
     capture_trajectories: bool = False,
+    concurrency: int = 1,
 ) -> tuple[float, list[dict]]:
-    """Evaluate agent on batch. Returns (accuracy, predictions)."""
+    """Evaluate agent on batch. Returns (accuracy, predictions).
+
+    With concurrency > 1, up to that many LLM calls are in flight at once
+    (threads: each call is an HTTP round-trip). Predictions keep example order.
+    Each example gets its own random.Random, seeded in order on the calling
+    thread, so a seeded run draws the same fallbacks at any concurrency.
+    """
     predictions = []
     correct = 0
+    rngs = [random.Random(random.getrandbits(64)) for _ in examples]
+    
+    if concurrency > 1 and len(examples) > 1:
+        pool = ThreadPoolExecutor(max_workers=min(len(examples), concurrency))
+        results = pool.map(lambda ex, rng: predict(agent, ex, llm_kwargs, rng), examples, rngs)
+    else:
+        pool = None
+        results = (predict(agent, ex, llm_kwargs, rng) for ex, rng in zip(examples, rngs))
     
-    for i, ex in enumerate(examples):
-        pred = predict(agent, ex, llm_kwargs)
-        predictions.append(pred)
-        if pred["correct"]:
-            correct += 1
-        if (i + 1) % 5 == 0:
-            print(f"    Agent {agent.id}: {i+1}/{len(examples)} examples ({correct}/{i+1} correct)", flush=True)
+    try:
+        for i, pred in enumerate(results):
+            predictions.append(pred)
+            if pred["correct"]:
+                correct += 1
+            if (i + 1) % 5 == 0:
+                print(f"    Agent {agent.id}: {i+1}/{len(examples)} examples ({correct}/{i+1} correct)", flush=True)
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
     accuracy = correct / len(examples) if examples else 0.0
     return accuracy, predictions
@@ -332,6 +355,7 @@ class EvolutionConfig:
     llm_kwargs: dict = field(default_factory=dict)
     eval_model: str = ""  # If set, use this model for predictions (faster); mutation uses default model
     mutation_model: str = ""  # If set, use this model for mutation/merge (smarter)
+    eval_concurrency: int = 1  # Parallel LLM calls per evaluate_batch (1 = serial)
 
 
 class EvolutionEngine:
@@ -538,7 +562,8 @@ class EvolutionEngine:
                 # Dev evaluation (for reflection)
                 dev_batch = random.sample(train_examples, min(cfg.dev_batch_size, len(train_examples)))
                 agent.dev_accuracy, dev_preds = evaluate_batch(
-                    agent, dev_batch, eval_kwargs, capture_trajectories=True
+                    agent, dev_batch, eval_kwargs, capture_trajectories=True,
+                    concurrency=cfg.eval_concurrency,
                 )
                 agent.dev_trajectories = dev_preds
                 
@@ -547,7 +572,7 @@ class EvolutionEngine:
                 if cfg.val_batch_size > 0:
                     val_batch = random.sample(val_examples, min(cfg.val_batch_size, len(val_examples)))
                 agent.val_accuracy, val_preds = evaluate_batch(
-                    agent, val_batch, eval_kwargs
+                    agent, val_batch, eval_kwargs, concurrency=cfg.eval_concurrency
                 )
                 agent.val_predictions = val_preds
                 self._update_pareto(agent, val_preds)
@@ -632,7 +657,9 @@ class EvolutionEngine:
                 
                 # Gate: evaluate child on dev batch
                 dev_batch = random.sample(train_examples, min(cfg.dev_batch_size, len(train_examples)))
-                child.dev_accuracy, _ = evaluate_batch(child, dev_batch, eval_kwargs)
+                child.dev_accuracy, _ = evaluate_batch(
+                    child, dev_batch, eval_kwargs, concurrency=cfg.eval_concurrency
+                )
                 
                 # Accept if not worse than parent
                 if child.dev_accuracy >= parent.dev_accuracy:
@@ -661,7 +688,7 @@ class EvolutionEngine:
                     
                     # Gate on val
                     merged.val_accuracy, val_preds = evaluate_batch(
-                        merged, val_examples, eval_kwargs
+                        merged, val_examples, eval_kwargs, concurrency=cfg.eval_concurrency
                     )
                     
                     parent_avg = (a.val_accuracy + b.val_accuracy) / 2
@@ -682,7 +709,9 @@ class EvolutionEngine:
         
         # === Final: Test best agent ===
         print(f"\n{'='*60}\nFinal Test\n{'='*60}")
-        test_accuracy, test_preds = evaluate_batch(best_agent, test_examples, eval_kwargs)
+        test_accuracy, test_preds = evaluate_batch(
+            best_agent, test_examples, eval_kwargs, concurrency=cfg.eval_concurrency
+        )
         print(f"Best agent {best_agent.id} (gen{best_agent.generation}):")
         print(f"  Val accuracy: {best_val_accuracy:.0%}")
         print(f"  Test accuracy: {test_accuracy:.0%}")
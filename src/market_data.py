@@ -97,7 +97,9 @@ def create_examples(
     examples = []
     
     for i in range(lookback, len(all_prices) - 1):
-        history = all_prices[:i+1]  # Everything up to today
+        # Only the lookback window up to today is rendered; slicing just that
+        # avoids copying the whole history (O(n^2) over the series)
+        history = all_prices[i + 1 - lookback:i + 1]
         tomorrow_date, tomorrow_price = all_prices[i+1]
         today_date, today_price = all_prices[i]
         
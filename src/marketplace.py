@@ -4,7 +4,7 @@ Generates requests, assigns agents, and processes transactions.
 """
 
 import random
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
 from src.agent import SimpleAgent
@@ -12,6 +12,16 @@ from src.clients import MinimalistClient, DocumenterClient, TesterClient, Pragma
 from src.database import Transaction, Database
 
 
+# Request pool (built once at import, reused by every generate_request)
+REQUEST_DESCRIPTIONS = (
+    "Function to calculate factorial",
+    "Class to parse CSV files",
+    "Function to validate email addresses",
+    "Function to merge two sorted lists",
+    "Class for a simple stack data structure",
+)
+
+
 @dataclass
 class Request:
     """Marketplace request for code generation."""
@@ -33,6 +43,7 @@ class Marketplace:
         """
         self.agents = agents
         self.db = db
+        self.max_generation = max((a.config.generation for a in agents), default=0)
         self.clients = [
             MinimalistClient(),
             DocumenterClient(),
@@ -48,17 +59,9 @@ class Marketplace:
         Returns:
             Request with description and assigned client
         """
-        descriptions = [
-            "Function to calculate factorial",
-            "Class to parse CSV files",
-            "Function to validate email addresses",
-            "Function to merge two sorted lists",
-            "Class for a simple stack data structure"
-        ]
-
         return Request(
             request_id=f"req_{len(self.transactions)}",
-            description=random.choice(descriptions),
+            description=random.choice(REQUEST_DESCRIPTIONS),
             client=random.choice(self.clients)
         )
 
@@ -105,18 +108,36 @@ class Marketplace:
         self.transactions.append(transaction)
         return transaction
 
-    def retire_old_agents(self, current_generation: int, max_lifespan: int = 40, max_gen_gap: int = 3):
+    def add_agent(self, agent: SimpleAgent):
+        """
+        Add a newborn agent to the population.
+
+        Keeps max_generation current so callers never rescan the population.
+
+        Args:
+            agent: Newly evolved agent
+        """
+        self.agents.append(agent)
+        if agent.config.generation > self.max_generation:
+            self.max_generation = agent.config.generation
+
+    def retire_old_agents(self, current_generation: Optional[int] = None,
+                          max_lifespan: int = 40, max_gen_gap: int = 3):
         """
         Remove agents that are too old or have too many transactions.
 
         Args:
             current_generation: Current max generation in population
+                                (defaults to the tracked max_generation)
             max_lifespan: Max transactions before retirement
             max_gen_gap: Max generations behind current
 
         Returns:
             List of retired agents
         """
+        if current_generation is None:
+            current_generation = self.max_generation
+
         active = []
         retired = []
 
@@ -132,5 +153,6 @@ class Marketplace:
             else:
                 active.append(agent)
 
-        self.agents = active
+        # In place, so every holder of self.agents sees the live population
+        self.agents[:] = active
         return retired
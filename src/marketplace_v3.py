@@ -8,7 +8,8 @@ Improvements:
 """
 
 import random
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from dataclasses import dataclass
 
 from src.agent import SimpleAgent
@@ -27,6 +28,25 @@ MAX_GEN_GAP = 2         # max generations behind (was 3)
 BANKRUPTCY_MIN_TXS = 5  # minimum txs before bankruptcy check
 BANKRUPTCY_AVG_PRICE = 6.0  # avg price below this = death
 
+# Request pool (built once at import, reused by every generate_request)
+REQUEST_DESCRIPTIONS = (
+    "Function to calculate factorial",
+    "Class to parse CSV files",
+    "Function to validate email addresses",
+    "Function to merge two sorted lists",
+    "Class for a simple stack data structure",
+    "Function to find the longest common subsequence",
+    "Class for a binary search tree",
+    "Function to convert Roman numerals to integers",
+    "Function to implement a simple cache (LRU)",
+    "Class for a priority queue",
+    "Function to flatten a nested dictionary",
+    "Function to check if a string is a valid palindrome",
+    "Function to generate Fibonacci sequence with memoization",
+    "Class for a simple linked list with insert/delete/search",
+    "Function to find all permutations of a string",
+)
+
 
 @dataclass
 class Request:
@@ -42,6 +62,7 @@ class MarketplaceV3:
     def __init__(self, agents: List[SimpleAgent], db: Database):
         self.agents = agents
         self.db = db
+        self.max_generation = max((a.config.generation for a in agents), default=0)
         self.clients = [
             MinimalistClient(),
             DocumenterClient(),
@@ -53,28 +74,10 @@ class MarketplaceV3:
 
     def generate_request(self) -> Request:
         """Generate request with more variety."""
-        descriptions = [
-            "Function to calculate factorial",
-            "Class to parse CSV files",
-            "Function to validate email addresses",
-            "Function to merge two sorted lists",
-            "Class for a simple stack data structure",
-            "Function to find the longest common subsequence",
-            "Class for a binary search tree",
-            "Function to convert Roman numerals to integers",
-            "Function to implement a simple cache (LRU)",
-            "Class for a priority queue",
-            "Function to flatten a nested dictionary",
-            "Function to check if a string is a valid palindrome",
-            "Function to generate Fibonacci sequence with memoization",
-            "Class for a simple linked list with insert/delete/search",
-            "Function to find all permutations of a string",
-        ]
-
         self.request_counter += 1
         return Request(
             request_id=f"req_{self.request_counter}",
-            description=random.choice(descriptions),
+            description=random.choice(REQUEST_DESCRIPTIONS),
             client=random.choice(self.clients)
         )
 
@@ -86,6 +89,50 @@ class MarketplaceV3:
         # Generate solution
         code, tokens_used, _ = agent.solve_request(request.description)
 
+        return self._settle(request, agent, code, tokens_used)
+
+    def process_requests(self, requests: List[Request],
+                         max_workers: Optional[int] = None) -> List[Transaction]:
+        """
+        Process a window of requests with the LLM calls running concurrently.
+
+        Only solve_request (an I/O-bound LLM round-trip) goes to the thread
+        pool. Agent selection, pricing and bookkeeping stay on the calling
+        thread, since they use the SQLite connection and mutate agent state.
+        Clients therefore choose from the market as it was at the start of
+        the window, not after each earlier request in it.
+
+        A request whose solve_request raises is reported and skipped; the
+        rest of the window is still settled.
+
+        Args:
+            requests: Requests to serve (e.g. one evolution window)
+            max_workers: Concurrent LLM calls (defaults to one per request)
+
+        Returns:
+            Transactions for the solved requests, in request order
+        """
+        if not requests:
+            return []
+
+        chosen = [r.client.select_agent(self.agents, self.db) for r in requests]
+        with ThreadPoolExecutor(max_workers=max_workers or len(requests)) as pool:
+            futures = [pool.submit(agent.solve_request, request.description)
+                       for request, agent in zip(requests, chosen)]
+
+        transactions = []
+        for request, agent, future in zip(requests, chosen, futures):
+            try:
+                code, tokens_used, _ = future.result()
+            except Exception as e:
+                print(f"  [SKIP] {request.request_id}: {agent.config.agent_id} failed: {e}")
+                continue
+            transactions.append(self._settle(request, agent, code, tokens_used))
+        return transactions
+
+    def _settle(self, request: Request, agent: SimpleAgent, code: str,
+                tokens_used: int) -> Transaction:
+        """Price generated code, charge simulated cost and record the sale."""
         # Calculate simulated cost (creates efficiency pressure)
         simulated_cost = tokens_used * COST_PER_TOKEN
 
@@ -113,15 +160,25 @@ class MarketplaceV3:
         self.transactions.append(transaction)
         return transaction
 
-    def retire_old_agents(self, current_generation: int):
+    def add_agent(self, agent: SimpleAgent):
+        """Add a newborn agent, keeping max_generation current."""
+        self.agents.append(agent)
+        if agent.config.generation > self.max_generation:
+            self.max_generation = agent.config.generation
+
+    def retire_old_agents(self, current_generation: Optional[int] = None):
         """
         Aggressive retirement + bankruptcy.
         
         Agents die if:
         1. Too many transactions (max_lifespan)
-        2. Too many generations behind
+        2. Too many generations behind (than current_generation, which
+           defaults to the tracked max_generation)
         3. Bankrupt (avg price too low after min txs)
         """
+        if current_generation is None:
+            current_generation = self.max_generation
+
         active = []
         retired = []
 
@@ -131,11 +188,8 @@ class MarketplaceV3:
             too_old = (current_generation - agent.config.generation) > MAX_GEN_GAP
             
             # Bankruptcy check
-            bankrupt = False
-            if agent.config.transaction_count >= BANKRUPTCY_MIN_TXS:
-                avg_price = agent.config.total_revenue / agent.config.transaction_count
-                if avg_price < BANKRUPTCY_AVG_PRICE:
-                    bankrupt = True
+            bankrupt = (agent.config.transaction_count >= BANKRUPTCY_MIN_TXS
+                        and agent.config.avg_price < BANKRUPTCY_AVG_PRICE)
 
             if too_many_txs or too_old or bankrupt:
                 reason = "lifespan" if too_many_txs else ("gen_gap" if too_old else "bankrupt")
@@ -145,16 +199,25 @@ class MarketplaceV3:
             else:
                 active.append(agent)
 
-        self.agents = active
+        # In place, so every holder of self.agents sees the live population
+        self.agents[:] = active
         return retired
 
     def get_market_stats(self):
-        """Get current market statistics."""
-        active = [a for a in self.agents if a.config.status == "active"]
+        """Get current market statistics (single pass over agents)."""
+        active_count = 0
+        total_revenue = 0.0
+        total_costs = 0.0
+        for a in self.agents:
+            if a.config.status == "active":
+                active_count += 1
+            total_revenue += a.config.total_revenue
+            total_costs += a.config.total_costs
+
         return {
-            'active_agents': len(active),
+            'active_agents': active_count,
             'total_transactions': len(self.transactions),
             'avg_price': sum(t.price_paid for t in self.transactions) / max(1, len(self.transactions)),
-            'total_revenue': sum(a.config.total_revenue for a in self.agents),
-            'total_costs': sum(a.config.total_costs for a in self.agents),
+            'total_revenue': total_revenue,
+            'total_costs': total_costs,
         }
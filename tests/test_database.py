@@ -4,6 +4,7 @@ Tests based on acceptance criteria from plan.
 """
 
 import pytest
+import sqlite3
 import tempfile
 import os
 import time
@@ -28,6 +29,13 @@ def temp_db():
     os.unlink(path)
 
 
+def test_agent_avg_price_guards_zero_transactions():
+    """avg_price is revenue per transaction, 0.0 before any sale."""
+    assert AgentConfig("new", 0, None, "P").avg_price == 0.0
+    assert AgentConfig("old", 0, None, "P", total_revenue=30.0,
+                       transaction_count=4).avg_price == pytest.approx(7.5)
+
+
 def test_save_and_load_agent(temp_db):
     """
     Acceptance criteria: Save agent → load → config identical
@@ -160,3 +168,182 @@ def test_agent_lineage_preserved(temp_db):
     child_loaded = next(a for a in agents if a.agent_id == "child_001")
     assert child_loaded.parent_id == "parent_001"
     assert child_loaded.generation == 1
+
+
+def test_connection_uses_wal(temp_db):
+    """
+    Connection is opened in WAL mode with relaxed sync for the tx loop.
+    """
+    mode = temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    sync = temp_db.conn.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert mode == "wal"
+    assert sync == 1  # NORMAL
+
+
+def test_batch_commits_once(temp_db):
+    """
+    Writes inside batch() become visible together on exit.
+    """
+    temp_db.save_agent(AgentConfig("batch_agent", 0, None, "Prompt"))
+    reader = Database(temp_db.db_path)
+
+    with temp_db.batch():
+        for i in range(3):
+            temp_db.save_transaction(Transaction(
+                f"req_{i}", "batch_agent", "pass", 10.0, "TestClient", "ok"))
+            temp_db.update_agent_revenue("batch_agent", 10.0)
+        assert reader.get_transaction_count_total() == 0
+
+    assert reader.get_transaction_count_total() == 3
+    assert reader.get_transaction_count("batch_agent") == 3
+    reader.close()
+
+
+def test_batch_rolls_back_on_error(temp_db):
+    """
+    An exception inside batch() discards the grouped writes.
+    """
+    temp_db.save_agent(AgentConfig("batch_agent", 0, None, "Prompt"))
+
+    with pytest.raises(RuntimeError):
+        with temp_db.batch():
+            temp_db.update_agent_revenue("batch_agent", 10.0)
+            raise RuntimeError("agent failed")
+
+    assert temp_db.get_transaction_count("batch_agent") == 0
+
+
+def test_nested_batch_skips_only_failed_item(temp_db):
+    """
+    A failing nested batch() is rolled back to its savepoint; the rest of
+    the outer window still commits.
+    """
+    temp_db.save_agent(AgentConfig("batch_agent", 0, None, "Prompt"))
+
+    with temp_db.batch():
+        for i in range(3):
+            try:
+                with temp_db.batch():
+                    temp_db.update_agent_revenue("batch_agent", 10.0)
+                    if i == 1:
+                        raise RuntimeError("bad transaction")
+            except RuntimeError:
+                continue
+
+    reader = Database(temp_db.db_path)
+    assert reader.get_transaction_count("batch_agent") == 2
+    reader.close()
+
+
+def test_save_transactions_bulk(temp_db):
+    """
+    save_transactions inserts every record.
+    """
+    temp_db.save_agent(AgentConfig("bulk_agent", 0, None, "Prompt"))
+    temp_db.save_transactions([
+        Transaction(f"req_{i}", "bulk_agent", "pass", 5.0, "TestClient", "ok")
+        for i in range(4)
+    ])
+
+    assert temp_db.get_transaction_count_total() == 4
+
+
+def test_update_agent_revenues_bulk(temp_db):
+    """Bulk revenue updates match repeated update_agent_revenue calls."""
+    temp_db.save_agent(AgentConfig("bulk_a", 0, None, "Prompt"))
+    temp_db.save_agent(AgentConfig("bulk_b", 0, None, "Prompt"))
+
+    temp_db.update_agent_revenues([
+        ("bulk_a", 10.0, 1.0),
+        ("bulk_b", 5.0, 0.5),
+        ("bulk_a", 12.0, 1.0),
+    ])
+
+    agents = {a.agent_id: a for a in temp_db.get_all_agents()}
+    assert agents["bulk_a"].transaction_count == 2
+    assert agents["bulk_a"].total_revenue == pytest.approx(22.0)
+    assert agents["bulk_b"].transaction_count == 1
+
+
+def test_get_active_agents_skips_retired(temp_db):
+    """Only active agents are loaded, still ordered by revenue."""
+    temp_db.save_agent(AgentConfig("low", 0, None, "P", total_revenue=5.0))
+    temp_db.save_agent(AgentConfig("high", 0, None, "P", total_revenue=50.0))
+    temp_db.save_agent(AgentConfig("gone", 0, None, "P", total_revenue=99.0))
+    temp_db.update_agent_status("gone", "retired")
+
+    active = temp_db.get_active_agents()
+
+    assert [a.agent_id for a in active] == ["high", "low"]
+
+
+def test_get_top_agents_by_profit(temp_db):
+    """
+    get_top_agents returns the N most profitable agents, best first.
+    """
+    for i, profit in enumerate([3.0, 30.0, 12.0, 7.0]):
+        temp_db.save_agent(AgentConfig(f"agent_{i}", 0, None, "Prompt", net_profit=profit))
+
+    top = temp_db.get_top_agents(limit=3)
+
+    assert [a.agent_id for a in top] == ["agent_1", "agent_2", "agent_3"]
+
+
+def test_gen_tx_distribution(temp_db):
+    """
+    Transactions are summed per generation by SQLite.
+    """
+    temp_db.save_agent(AgentConfig("g0_a", 0, None, "Prompt", transaction_count=4))
+    temp_db.save_agent(AgentConfig("g0_b", 0, None, "Prompt", transaction_count=6))
+    temp_db.save_agent(AgentConfig("g2_a", 2, "g0_a", "Prompt", transaction_count=3))
+
+    assert temp_db.get_gen_tx_distribution() == [(0, 10), (2, 3)]
+
+
+def test_generation_stats(temp_db):
+    """Per-generation totals and averages come from one GROUP BY."""
+    temp_db.save_agent(AgentConfig("g0_a", 0, None, "P", total_revenue=30.0,
+                                   transaction_count=3, total_costs=6.0))
+    temp_db.save_agent(AgentConfig("g0_b", 0, None, "P", total_revenue=10.0,
+                                   transaction_count=1, total_costs=2.0))
+    temp_db.save_agent(AgentConfig("g1_a", 1, "g0_a", "P"))
+
+    stats = temp_db.get_generation_stats()
+
+    assert list(stats) == [0, 1]
+    assert stats[0]['agents'] == 2
+    assert stats[0]['total_txs'] == 4
+    assert stats[0]['avg_rev'] == pytest.approx(20.0)
+    assert stats[0]['avg_price'] == pytest.approx(10.0)
+    assert stats[0]['avg_profit'] == pytest.approx(16.0)
+    assert stats[1]['avg_price'] == 0.0
+
+
+def test_lineage_revenues_match_single_queries(temp_db):
+    """
+    Batched CMP scores equal the per-agent recursive query.
+    """
+    temp_db.save_agent(AgentConfig("root", 0, None, "Prompt", total_revenue=10.0))
+    temp_db.save_agent(AgentConfig("child", 1, "root", "Prompt", total_revenue=5.0))
+    temp_db.save_agent(AgentConfig("grandchild", 2, "child", "Prompt", total_revenue=2.5))
+    temp_db.save_agent(AgentConfig("other", 0, None, "Prompt", total_revenue=7.0))
+
+    ids = ["root", "child", "grandchild", "other", "missing"]
+    scores = temp_db.get_lineage_revenues(ids)
+
+    assert scores == {i: temp_db.get_lineage_revenue(i) for i in ids}
+    assert scores["root"] == pytest.approx(17.5)
+
+
+def test_read_only_connection(temp_db):
+    """
+    A read-only Database sees committed data and rejects writes.
+    """
+    temp_db.save_agent(AgentConfig("ro_agent", 0, None, "Prompt"))
+    reader = Database(temp_db.db_path, read_only=True)
+
+    assert [a.agent_id for a in reader.get_all_agents()] == ["ro_agent"]
+    with pytest.raises(sqlite3.OperationalError):
+        reader.update_agent_status("ro_agent", "retired")
+    reader.close()
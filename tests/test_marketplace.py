@@ -6,6 +6,7 @@ Tests based on acceptance criteria from plan.
 import pytest
 from unittest.mock import Mock, patch
 from src.marketplace import Marketplace, Request
+from src.marketplace_v3 import MarketplaceV3
 from src.agent import SimpleAgent
 from src.database import AgentConfig
 
@@ -128,3 +129,101 @@ def test_marketplace_tracks_transactions(marketplace):
     # Assert
     assert len(marketplace.transactions) == initial_count + 1
     assert marketplace.transactions[-1].agent_id == agent.config.agent_id
+
+
+def test_add_agent_tracks_max_generation(test_agents):
+    """
+    add_agent keeps max_generation current; retirement uses it by default.
+    """
+    market = Marketplace(list(test_agents), Mock())
+    assert market.max_generation == 0
+
+    for gen in (1, 2, 4):
+        market.add_agent(SimpleAgent(AgentConfig(f"agent_gen{gen}", gen, None, "Test prompt")))
+    assert market.max_generation == 4
+
+    retired = market.retire_old_agents()
+
+    # Generation-0 agents are more than 3 generations behind
+    assert {a.config.agent_id for a in retired} == {a.config.agent_id for a in test_agents}
+    assert [a.config.generation for a in market.agents] == [1, 2, 4]
+
+
+def test_v3_process_requests_keeps_request_order():
+    """
+    A concurrently solved window yields one transaction per request, in order.
+    """
+    test_agents = [
+        Mock(config=AgentConfig(f"test_agent_{i}", 0, None, "Test prompt"),
+             solve_request=Mock(return_value=(f"def f{i}(): pass", 100, 0.0)))
+        for i in range(3)
+    ]
+    market = MarketplaceV3(list(test_agents), Mock())
+
+    requests = [market.generate_request() for _ in range(6)]
+    for i, request in enumerate(requests):
+        request.client = Mock()
+        request.client.select_agent.return_value = test_agents[i % 3]
+        request.client.evaluate.return_value = Mock(
+            price_paid=10.0, client_name="MockClient", feedback="ok")
+
+    transactions = market.process_requests(requests, max_workers=3)
+
+    assert [t.request_id for t in transactions] == [r.request_id for r in requests]
+    assert [t.agent_id for t in transactions] == [test_agents[i % 3].config.agent_id for i in range(6)]
+    assert all(a.config.transaction_count == 2 for a in test_agents)
+    assert market.transactions == transactions
+
+
+def test_v3_add_agent_tracks_max_generation(test_agents):
+    """
+    MarketplaceV3 retires against the tracked max generation by default.
+    """
+    market = MarketplaceV3(list(test_agents), Mock())
+    market.add_agent(SimpleAgent(AgentConfig("agent_gen3", 3, None, "Test prompt")))
+    assert market.max_generation == 3
+
+    retired = market.retire_old_agents()
+
+    assert {a.config.agent_id for a, reason in retired} == {a.config.agent_id for a in test_agents}
+    assert all(reason == "gen_gap" for _, reason in retired)
+    assert [a.config.agent_id for a in market.agents] == ["agent_gen3"]
+
+
+def test_retirement_updates_agent_list_in_place(test_agents):
+    """
+    References to marketplace.agents taken earlier stay in sync after retirement.
+    """
+    market = MarketplaceV3(list(test_agents), Mock())
+    active = market.agents
+    test_agents[0].config.transaction_count = 99
+
+    market.retire_old_agents(0)
+
+    assert market.agents is active
+    assert test_agents[0] not in active
+    assert len(active) == 2
+
+
+def test_v3_process_requests_settles_around_failures():
+    """
+    A failed LLM call skips its request without discarding the rest of the window.
+    """
+    ok = Mock(config=AgentConfig("ok_agent", 0, None, "Test prompt"),
+              solve_request=Mock(return_value=("def f(): pass", 100, 0.0)))
+    broken = Mock(config=AgentConfig("broken_agent", 0, None, "Test prompt"),
+                  solve_request=Mock(side_effect=RuntimeError("LLM down")))
+    market = MarketplaceV3([ok, broken], Mock())
+
+    requests = [market.generate_request() for _ in range(3)]
+    for request, agent in zip(requests, [ok, broken, ok]):
+        request.client = Mock()
+        request.client.select_agent.return_value = agent
+        request.client.evaluate.return_value = Mock(
+            price_paid=10.0, client_name="MockClient", feedback="ok")
+
+    transactions = market.process_requests(requests)
+
+    assert [t.request_id for t in transactions] == [requests[0].request_id, requests[2].request_id]
+    assert ok.config.transaction_count == 2
+    assert broken.config.transaction_count == 0